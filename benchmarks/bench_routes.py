@@ -0,0 +1,231 @@
+"""
+Route benchmarks at several data sizes.
+
+    python benchmarks/bench_routes.py --sizes 500,2000,10000 --repeat 5
+    python benchmarks/bench_routes.py --sizes 2000 --compare
+
+Every size runs in a fresh subprocess against its own SQLite file
+(DATABASE_URL), filled by seed_synthetic_data() -- the same generator as
+`flask seed`. Each route is timed through the Flask test client; median /
+p95 latency and SQL statements per request (from the /metrics
+instrumentation) are printed and appended to benchmarks/results.jsonl.
+--compare flags routes that got slower than the previous recorded run of
+the same size.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+DEFAULT_RESULTS = os.path.join(HERE, "results.jsonl")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[max(int(math.ceil(pct / 100.0 * len(ordered))) - 1, 0)]
+
+
+def bench_cases(A):
+    """(name, method, url, kwargs) for every route, using real sample rows."""
+    db = A.db
+    busy_account = (
+        db.session.query(A.Transaction.account_no)
+        .group_by(A.Transaction.account_no)
+        .order_by(db.func.count(A.Transaction.id).desc())
+        .limit(1)
+        .scalar()
+    )
+    loan = A.Loan.query.order_by(A.Loan.id.desc()).first()
+    accounts = [a for (a,) in db.session.query(A.Member.account_no).limit(20)]
+    last_name = A.Member.query.first().name.split()[-1]
+    today = date.today()
+    last_month = today.replace(day=1) - timedelta(days=1)
+    batch_lines = [
+        {"account_no": a, "credit_type": "Member Received", "amount": "10"} for a in accounts
+    ]
+
+    cases = [
+        ("dashboard", "GET", "/dashboard", {}),
+        ("member", "GET", f"/member?account_no={busy_account}", {}),
+        ("member name search", "POST", "/member",
+         {"data": {"action": "search", "search_type": "name", "query": last_name}}),
+        ("statement", "GET", f"/statement?account_no={busy_account}", {}),
+        ("statement 90d", "GET",
+         f"/statement?account_no={busy_account}&from_date={today - timedelta(days=90)}", {}),
+        ("statement csv", "GET", f"/statement?account_no={busy_account}&export=csv", {}),
+        ("debit_statement", "GET", "/debit_statement", {}),
+        ("credit_statement", "GET", "/credit/statement", {}),
+        ("loan_statement", "GET", "/loan_statement", {}),
+        ("misc_statement", "GET", "/misc_statement", {}),
+        ("fd_statement", "GET", "/fd_statement", {}),
+        ("rd_statement", "GET", "/rd_statement", {}),
+        ("monthly_report", "POST", "/monthly_report",
+         {"data": {"month": str(last_month.month), "year": str(last_month.year)}}),
+        ("portfolio_report", "GET", "/portfolio_report", {}),
+        ("collection_sheet", "GET", "/collection_sheet?overdue=1", {}),
+        ("maturity_report", "GET", "/maturity_report?days=90", {}),
+        ("api portfolio_aging", "GET", "/api/portfolio_aging", {}),
+        ("api member_search", "GET", f"/api/member_search?q={last_name[:3]}", {}),
+        ("api member_names", "GET", "/api/member_names?accounts=" + ",".join(accounts), {}),
+        ("api ledger_totals", "GET", "/api/ledger_totals", {}),
+        ("api loan_quote grid", "GET", "/api/loan_quote?principals=10000,50000,100000&rates=10,12,14,18&tenures=6,12,24,36&method=reducing", {}),
+        ("post credit", "POST", "/credit",
+         {"data": {"account_no": busy_account, "credit_type": "Member Received",
+                   "amount": "10", "mode": "Cash", "date": today.isoformat()}}),
+        ("post debit", "POST", "/debit",
+         {"data": {"account_no": busy_account, "debit_type": "Member Closed",
+                   "amount": "1", "mode": "Cash", "date": today.isoformat()}}),
+        ("post misc", "POST", "/misc",
+         {"data": {"head": "Stationery", "amount": "5", "date": today.isoformat()}}),
+        ("post credit batch x20", "POST", "/credit/batch",
+         {"json": {"date": today.isoformat(), "lines": batch_lines}}),
+    ]
+    if loan:
+        cases.insert(4, ("member_loan_statement", "GET",
+                         f"/member_loan_statement/{loan.loan_id}", {}))
+        cases.append(("post emi", "POST", "/credit",
+                      {"data": {"account_no": loan.account_no,
+                                "credit_type": f"{loan.loan_type} Loan EMI Received",
+                                "amount": "1", "mode": "Cash", "date": today.isoformat()}}))
+    return cases
+
+
+def run_size(size, repeat, months, seed):
+    """Child process: seed a fresh database of `size` members and time every route."""
+    sys.path.insert(0, ROOT)
+    import app as A
+
+    A.app.config["TESTING"] = True
+    with A.app.app_context():
+        A.db.create_all()
+        A.create_default_admin()
+        started = time.perf_counter()
+        counts = A.seed_synthetic_data(size, months=months, seed=seed)
+        seed_seconds = time.perf_counter() - started
+        cases = bench_cases(A)
+
+    client = A.app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+        sess["username"] = "admin"
+
+    results = []
+    for name, method, url, kwargs in cases:
+        client.open(url, method=method, **kwargs)  # warm-up
+        A.metrics.reset()
+        timings, errors = [], 0
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            resp = client.open(url, method=method, **kwargs)
+            resp.get_data()
+            timings.append((time.perf_counter() - t0) * 1000)
+            if resp.status_code >= 400:
+                errors += 1
+        sql = sum(A.metrics.sql_count.values())
+        results.append({
+            "route": name,
+            "median_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "sql_per_request": round(sql / repeat, 1),
+            "errors": errors,
+        })
+    return {"size": size, "rows": counts, "seed_seconds": round(seed_seconds, 2),
+            "results": results}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_previous(path):
+    """(size, route) -> last recorded result."""
+    previous = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    row = json.loads(line)
+                    previous[(row["size"], row["route"])] = row
+    return previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="500,2000,5000", help="Comma-separated member counts.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed requests per route.")
+    parser.add_argument("--months", type=int, default=12, help="History window per member.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="JSONL file to append to.")
+    parser.add_argument("--compare", action="store_true",
+                        help="Flag routes slower than the previous run of the same size.")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="Slowdown ratio reported by --compare.")
+    parser.add_argument("--run-size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_size:
+        print(json.dumps(run_size(args.run_size, args.repeat, args.months, args.seed)))
+        return 0
+
+    previous = load_previous(args.results) if args.compare else {}
+    commit = git_commit()
+    stamp = datetime.utcnow().isoformat(timespec="seconds")
+    regressions = []
+    workdir = tempfile.mkdtemp(prefix="finance-bench-")
+
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(workdir, f'bench_{size}.db')}",
+            CACHE_BACKEND="null",
+            METRICS_ENABLED="1",
+            SLOW_QUERY_MS="100000",
+        )
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-size", str(size),
+             "--repeat", str(args.repeat), "--months", str(args.months), "--seed", str(args.seed)],
+            env=env, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            sys.stderr.write(out.stderr)
+            return out.returncode
+        report = json.loads(out.stdout.strip().splitlines()[-1])
+
+        print(f"\n== {size} members ({report['rows']['credits']} credits, "
+              f"{report['rows']['sb_transactions']} SB txns; seeded in {report['seed_seconds']}s)")
+        print(f"{'route':<26}{'median ms':>11}{'p95 ms':>10}{'sql/req':>9}{'errors':>8}")
+        with open(args.results, "a", encoding="utf-8") as fh:
+            for r in report["results"]:
+                flag = ""
+                before = previous.get((size, r["route"]))
+                if before and before["median_ms"] > 0:
+                    ratio = r["median_ms"] / before["median_ms"]
+                    if ratio >= args.threshold:
+                        flag = f"  << {ratio:.1f}x slower than {before.get('commit') or 'previous'}"
+                        regressions.append((size, r["route"], ratio))
+                print(f"{r['route']:<26}{r['median_ms']:>11.2f}{r['p95_ms']:>10.2f}"
+                      f"{r['sql_per_request']:>9}{r['errors']:>8}{flag}")
+                fh.write(json.dumps(dict(r, size=size, commit=commit, ts=stamp)) + "\n")
+
+    print(f"\nResults appended to {args.results}")
+    if regressions:
+        print(f"{len(regressions)} route(s) slower than threshold {args.threshold}x.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Teller-workflow load driver for a running instance.
+
+    gunicorn -w 4 -b 127.0.0.1:8000 app:app
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --concurrency 20 --duration 60
+
+Each virtual teller logs in (solving the login captcha), then loops over a
+weighted mix of account lookups, credit / debit postings, statement views
+and the monthly report until --duration runs out. Throughput and p50 / p95
+/ p99 latency are reported per endpoint, together with HTTP errors, postings
+the app rejected (danger flash) and unique-constraint failures (409 from the
+IntegrityError handler, or a database message in a 500 body).
+
+Postings are real: point it at a seeded copy (`flask seed`), never at live
+data. Only the standard library is used.
+"""
+import argparse
+import http.cookiejar
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from datetime import date, timedelta
+
+DEFAULT_MIX = (
+    "lookup=20,name_api=10,credit=25,debit=8,statement=15,"
+    "credit_statement=5,loan_statement=4,dashboard=8,monthly_report=3,emi=2"
+)
+CAPTCHA_RE = re.compile(r"Captcha:\s*<strong>\s*(\d+)\s*\+\s*(\d+)\s*</strong>")
+UNIQUE_RE = re.compile(r"UNIQUE constraint|Duplicate entry|IntegrityError|duplicate key", re.I)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[max(int(math.ceil(pct / 100.0 * len(ordered))) - 1, 0)]
+
+
+class Stats:
+    """Latencies and outcome counters per endpoint, shared by all tellers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.counters = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, seconds, outcome):
+        with self.lock:
+            self.latencies[endpoint].append(seconds)
+            self.counters[endpoint][outcome] += 1
+
+    def report(self, elapsed):
+        rows = []
+        for endpoint in sorted(self.latencies):
+            lat = [s * 1000 for s in self.latencies[endpoint]]
+            counts = self.counters[endpoint]
+            rows.append({
+                "endpoint": endpoint,
+                "requests": len(lat),
+                "rps": round(len(lat) / elapsed, 2),
+                "p50_ms": round(percentile(lat, 50), 2),
+                "p95_ms": round(percentile(lat, 95), 2),
+                "p99_ms": round(percentile(lat, 99), 2),
+                "errors": counts["error"],
+                "rejected": counts["rejected"],
+                "unique_failures": counts["unique"],
+            })
+        return rows
+
+
+class Teller:
+    """One virtual teller: its own cookie jar (session) and request loop."""
+
+    def __init__(self, base_url, username, password, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def request(self, path, data=None):
+        """(status, body text); HTTP errors are returned, not raised."""
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        try:
+            with self.opener.open(self.base_url + path, data=body, timeout=self.timeout) as resp:
+                return resp.status, resp.read().decode("utf-8", "replace")
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read().decode("utf-8", "replace")
+
+    def login(self):
+        status, page = self.request("/login")
+        match = CAPTCHA_RE.search(page)
+        if status != 200 or not match:
+            return status, page
+        answer = int(match.group(1)) + int(match.group(2))
+        return self.request("/login", {
+            "username": self.username, "password": self.password, "captcha": str(answer),
+        })
+
+
+def classify(status, body, posting=False):
+    if status == 409 or (status >= 500 and UNIQUE_RE.search(body)):
+        return "unique"
+    if status >= 400:
+        return "error"
+    if posting and "alert alert-danger" in body:
+        return "rejected"
+    return "ok"
+
+
+def build_actions(accounts, loan_accounts):
+    """name -> callable(teller) returning (status, body, is_posting)."""
+    today = date.today().isoformat()
+    last_month = date.today().replace(day=1) - timedelta(days=1)
+
+    def pick():
+        return random.choice(accounts)
+
+    def lookup(t):
+        return t.request(f"/member?account_no={pick()}") + (False,)
+
+    def name_api(t):
+        sample = random.sample(accounts, min(5, len(accounts)))
+        return t.request("/api/member_names?accounts=" + ",".join(sample)) + (False,)
+
+    def credit(t):
+        return t.request("/credit", {
+            "account_no": pick(), "credit_type": "Member Received", "mode": "Cash",
+            "amount": str(random.choice([50, 100, 200, 500])), "date": today,
+        }) + (True,)
+
+    def debit(t):
+        return t.request("/debit", {
+            "account_no": pick(), "debit_type": "Member Closed", "mode": "Cash",
+            "amount": str(random.choice([10, 20, 50])), "date": today,
+        }) + (True,)
+
+    def emi(t):
+        account_no, loan_type = random.choice(loan_accounts)
+        return t.request("/credit", {
+            "account_no": account_no, "credit_type": f"{loan_type} Loan EMI Received",
+            "mode": "Cash", "amount": "100", "date": today,
+        }) + (True,)
+
+    def statement(t):
+        return t.request(f"/statement?account_no={pick()}") + (False,)
+
+    def monthly_report(t):
+        return t.request("/monthly_report", {
+            "month": str(last_month.month), "year": str(last_month.year),
+        }) + (False,)
+
+    actions = {
+        "lookup": lookup,
+        "name_api": name_api,
+        "credit": credit,
+        "debit": debit,
+        "statement": statement,
+        "credit_statement": lambda t: t.request("/credit/statement") + (False,),
+        "loan_statement": lambda t: t.request("/loan_statement") + (False,),
+        "dashboard": lambda t: t.request("/dashboard") + (False,),
+        "monthly_report": monthly_report,
+    }
+    if loan_accounts:
+        actions["emi"] = emi
+    return actions
+
+
+def discover_accounts(teller, account_range):
+    """Existing account numbers in "first-last" (checked 200 at a time)."""
+    first, _, last = account_range.partition("-")
+    candidates = [str(n) for n in range(int(first), int(last or first) + 1)]
+    found = []
+    for i in range(0, len(candidates), 200):
+        status, body = teller.request(
+            "/api/member_names?accounts=" + ",".join(candidates[i:i + 200])
+        )
+        if status == 200:
+            found += sorted(json.loads(body)["members"])
+    return found
+
+
+def discover_loan_accounts(teller, limit=200):
+    """(account_no, loan_type) pairs scraped from the loan statement."""
+    _, page = teller.request("/loan_statement")
+    pairs = re.findall(r"<td>\s*(\d{4,})\s*</td>\s*<td>\s*(Weekly|Monthly)\s*</td>", page, re.S)
+    return list(dict.fromkeys(pairs))[:limit]
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip():
+            mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def run_teller(args, actions, mix, stats, start):
+    teller = Teller(args.url, args.username, args.password, args.timeout)
+    started = time.perf_counter()
+    status, body = teller.login()
+    stats.record("login", time.perf_counter() - started,
+                 "ok" if status == 200 and "captcha" not in body.lower() else "error")
+    start["event"].wait()
+    deadline = start["deadline"]
+
+    names = [n for n in mix if n in actions]
+    weights = [mix[n] for n in names]
+    while time.time() < deadline:
+        name = random.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            status, body, posting = actions[name](teller)
+            outcome = classify(status, body, posting)
+        except OSError:
+            outcome = "error"
+        stats.record(name, time.perf_counter() - started, outcome)
+        if args.think_ms:
+            time.sleep(random.uniform(0, 2 * args.think_ms) / 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual tellers.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run.")
+    parser.add_argument("--think-ms", type=float, default=0,
+                        help="Mean pause between a teller's requests.")
+    parser.add_argument("--accounts", default="10001-12000",
+                        help="Account number range to draw from (only existing ones are used).")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="name=weight,... of actions.")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--json", help="Also write the report to this file.")
+    args = parser.parse_args()
+
+    probe = Teller(args.url, args.username, args.password, args.timeout)
+    status, body = probe.login()
+    if status != 200 or "captcha" in body.lower():
+        sys.exit(f"Login failed against {args.url} (HTTP {status})")
+    accounts = discover_accounts(probe, args.accounts)
+    if not accounts:
+        sys.exit(f"No members found in account range {args.accounts}; run `flask seed` first")
+    loan_accounts = discover_loan_accounts(probe)
+    actions = build_actions(accounts, loan_accounts)
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - set(actions)
+    if unknown:
+        print(f"Skipping unavailable actions: {', '.join(sorted(unknown))}")
+
+    print(f"{args.concurrency} tellers for {args.duration:.0f}s against {args.url} "
+          f"({len(accounts)} accounts, {len(loan_accounts)} loans)")
+    stats = Stats()
+    # the clock starts once every teller has logged in
+    start = {"event": threading.Event(), "deadline": None}
+    threads = [
+        threading.Thread(target=run_teller, args=(args, actions, mix, stats, start), daemon=True)
+        for _ in range(args.concurrency)
+    ]
+    for t in threads:
+        t.start()
+    while sum(stats.counters["login"].values()) < args.concurrency:
+        time.sleep(0.05)
+    started = time.time()
+    start["deadline"] = started + args.duration
+    start["event"].set()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - started
+
+    rows = stats.report(elapsed)
+    print(f"\n{'endpoint':<18}{'reqs':>7}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'errors':>8}{'rejected':>10}{'unique':>8}")
+    for r in rows:
+        print(f"{r['endpoint']:<18}{r['requests']:>7}{r['rps']:>8}{r['p50_ms']:>9}{r['p95_ms']:>9}"
+              f"{r['p99_ms']:>9}{r['errors']:>8}{r['rejected']:>10}{r['unique_failures']:>8}")
+    work = [r for r in rows if r["endpoint"] != "login"]
+    total = sum(r["requests"] for r in work)
+    print(f"\n{total} requests in {elapsed:.1f}s = {total / elapsed:.1f} req/s; "
+          f"errors {sum(r['errors'] for r in work)}, "
+          f"unique-constraint failures {sum(r['unique_failures'] for r in work)}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"concurrency": args.concurrency, "duration": elapsed,
+                       "throughput": total / elapsed, "endpoints": rows}, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -76,28 +76,87 @@ document.addEventListener("DOMContentLoaded", function () {
     setInterval(updateClock, 1000);
 
     // ====================================================
-    // HEADER SEARCH (account no / mobile)
+    // HEADER SEARCH (account no / mobile / name typeahead)
     // ====================================================
-    const headerSearchForm = document.getElementById("header-search-form");
-    const headerSearchInput = document.getElementById("header-search-input");
+    const headerSearchForm = document.getElementById("global-search-form");
+    const headerSearchInput = document.getElementById("global-search-input");
+    const suggestionList = document.getElementById("global-search-suggestions");
+
+    function openMember(accountNo) {
+        window.location.href = `/member?account_no=${encodeURIComponent(accountNo)}`;
+    }
+
+    if (headerSearchForm && headerSearchInput && suggestionList) {
+        let searchTimer = null;
+        let searchSeq = 0;
+        let suggestions = [];
+
+        function hideSuggestions() {
+            suggestionList.classList.add("hidden");
+            suggestionList.innerHTML = "";
+            suggestions = [];
+        }
+
+        function showSuggestions(results) {
+            suggestions = results;
+            suggestionList.innerHTML = "";
+            if (!results.length) {
+                suggestionList.classList.add("hidden");
+                return;
+            }
+            results.forEach((m) => {
+                const li = document.createElement("li");
+                li.textContent = `${m.account_no} – ${m.name}${m.mobile ? " (" + m.mobile + ")" : ""}`;
+                li.addEventListener("mousedown", (e) => {
+                    e.preventDefault();
+                    openMember(m.account_no);
+                });
+                suggestionList.appendChild(li);
+            });
+            suggestionList.classList.remove("hidden");
+        }
+
+        headerSearchInput.addEventListener("input", function () {
+            const q = headerSearchInput.value.trim();
+            clearTimeout(searchTimer);
+            if (!q) {
+                hideSuggestions();
+                return;
+            }
+            searchTimer = setTimeout(() => {
+                const seq = ++searchSeq;
+                fetch(`/api/member_search?q=${encodeURIComponent(q)}&limit=8`)
+                    .then((r) => r.json())
+                    .then((data) => {
+                        // ignore responses for older keystrokes
+                        if (seq !== searchSeq) return;
+                        showSuggestions(data.success ? data.results : []);
+                    })
+                    .catch(() => hideSuggestions());
+            }, 200);
+        });
+
+        headerSearchInput.addEventListener("blur", hideSuggestions);
 
-    if (headerSearchForm && headerSearchInput) {
         headerSearchForm.addEventListener("submit", function (e) {
             e.preventDefault();
             const q = headerSearchInput.value.trim();
             if (!q) return;
 
-            fetch(`/search_member?q=${encodeURIComponent(q)}`)
+            if (suggestions.length) {
+                openMember(suggestions[0].account_no);
+                return;
+            }
+
+            fetch(`/api/member_search?q=${encodeURIComponent(q)}&limit=1`)
                 .then((r) => r.json())
                 .then((data) => {
-                    if (!data.success) {
+                    if (!data.success || !data.results.length) {
                         alert("Member not found");
                         return;
                     }
                     // Go to member page and let user see details
-                    window.location.href = `/member?account_no=${encodeURIComponent(
-                        data.member.account_no
-                    )}`;
+                    openMember(data.results[0].account_no);
                 })
                 .catch(() => {
                     alert("Error searching member.");
@@ -168,6 +227,44 @@ document.addEventListener("DOMContentLoaded", function () {
     const startDateEl  = document.getElementById("loan-start-date");
     const endDateEl    = document.getElementById("loan-end-date");
 
+    // ---- Batched member name lookup ----
+    // Lookups made in the same tick go out as ONE /api/member_names request.
+    const memberNames = {};
+    let pendingLookups = {};
+    let lookupTimer = null;
+
+    function flushMemberLookups() {
+        const batch = pendingLookups;
+        pendingLookups = {};
+        lookupTimer = null;
+
+        const accounts = Object.keys(batch).sort();
+        const qs = accounts.map((a) => `account_no=${encodeURIComponent(a)}`).join("&");
+        fetch(`/api/member_names?${qs}`)
+            .then((r) => r.json())
+            .then((data) => {
+                const members = (data && data.members) || {};
+                accounts.forEach((acc) => {
+                    const name = members[acc] ? members[acc].name : "";
+                    if (name) memberNames[acc] = name;
+                    batch[acc].forEach((resolve) => resolve(name));
+                });
+            })
+            .catch(() => {
+                accounts.forEach((acc) => batch[acc].forEach((resolve) => resolve("")));
+            });
+    }
+
+    function lookupMemberName(accountNo) {
+        if (memberNames[accountNo]) {
+            return Promise.resolve(memberNames[accountNo]);
+        }
+        return new Promise((resolve) => {
+            (pendingLookups[accountNo] = pendingLookups[accountNo] || []).push(resolve);
+            if (!lookupTimer) lookupTimer = setTimeout(flushMemberLookups, 25);
+        });
+    }
+
     // ---- Auto Member Name for LOAN page (special fields) ----
     function loadMemberName() {
         if (!accInput || !nameInput) return;
@@ -176,18 +273,9 @@ document.addEventListener("DOMContentLoaded", function () {
             nameInput.value = "";
             return;
         }
-        fetch(`/api/member_name?account_no=${encodeURIComponent(val)}`)
-            .then((r) => r.json())
-            .then((data) => {
-                if (data.success) {
-                    nameInput.value = data.name;
-                } else {
-                    nameInput.value = "";
-                }
-            })
-            .catch(() => {
-                nameInput.value = "";
-            });
+        lookupMemberName(val).then((name) => {
+            nameInput.value = name;
+        });
     }
 
     if (accInput && nameInput) {
@@ -300,37 +388,10 @@ document.addEventListener("DOMContentLoaded", function () {
             return;
         }
 
-        fetch(`/api/member_name?account_no=${encodeURIComponent(val)}`)
-            .then((r) => r.json())
-            .then((data) => {
-                if (data.success) {
-                    nameField.value = data.name;
-                } else {
-                    nameField.value = "";
-                }
-            })
-            .catch(() => {
-                nameField.value = "";
-            });
-    }
-
-    // Attach to all account_no inputs EXCEPT loan page (already handled)
-    const accountInputs = document.querySelectorAll('input[name="account_no"]');
-    accountInputs.forEach((inp) => {
-        if (inp.id === "loan-account-no") {
-            return; // loan uses special handler above
-        }
-        inp.addEventListener("change", () => autoFillNameFor(inp));
-        inp.addEventListener("blur", () => autoFillNameFor(inp));
-        inp.addEventListener("keyup", (e) => {
-            if (e.key === "Enter") {
-                autoFillNameFor(inp);
-            }
+        lookupMemberName(val).then((name) => {
+            nameField.value = name;
         });
-    });
-
-});
-
+    }
 
     // Attach to all account_no inputs EXCEPT loan page (already handled)
     const accountInputs = document.querySelectorAll('input[name="account_no"]');
@@ -345,6 +406,10 @@ document.addEventListener("DOMContentLoaded", function () {
                 autoFillNameFor(inp);
             }
         });
+        // Pre-filled forms (e.g. re-rendered after an error): one batched request
+        if (inp.value.trim()) autoFillNameFor(inp);
     });
 
+    if (accInput && accInput.value.trim()) loadMemberName();
 
+});